@@ -1,27 +1,36 @@
-from typing import List
-
-from lectures.advanced.main import get_advanced_modeling_lecture
-from lectures.basic_qa.main import get_basic_q_and_a_lecture
-from lectures.combining_excel_python.main import get_combining_excel_python_lecture
-from lectures.data_pipelines.main import get_data_pipelines_lecture
-from lectures.dcf_cost_capital.main import get_dcf_cost_capital_lecture
-from lectures.dcf_fcf.main import get_dcf_fcf_lecture
-from lectures.dynamic_excel.main import get_dynamic_salary_excel_lecture
-from lectures.dynamic_python.main import get_dynamic_salary_python_lecture
-from lectures.intro.main import get_intro_lecture
-from lectures.lab_exercises.main import get_lab_exercises_lecture
-from lectures.model import LectureGroup
-from lectures.monte_carlo.main import get_monte_carlo_lecture
-from lectures.probability.main import get_probability_lecture
-from lectures.projects.main import get_projects_lecture
-from lectures.python_basics.main import get_python_basics_lecture
-from lectures.sensitivity_analysis.main import get_sensitivity_analysis_lecture
-from lectures.start_python_excel.main import get_getting_started_with_python_and_excel_lecture
-from lectures.visualization.main import get_visualization_lecture
-
-
-def get_lecture_groups(include_labs: bool = True, include_projects: bool = True) -> List[LectureGroup]:
-    lectures = [
+from functools import lru_cache
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lectures.model import LectureGroup
+
+
+def get_lecture_groups(include_labs: bool = True, include_projects: bool = True) -> List['LectureGroup']:
+    # Cached value is a tuple so callers get their own list and can't mutate the cache
+    return list(_get_lecture_group_variants()[(include_labs, include_projects)])
+
+
+@lru_cache(maxsize=None)
+def _get_lecture_group_variants() -> Dict[Tuple[bool, bool], Tuple['LectureGroup', ...]]:
+    from lectures.advanced.main import get_advanced_modeling_lecture
+    from lectures.basic_qa.main import get_basic_q_and_a_lecture
+    from lectures.combining_excel_python.main import get_combining_excel_python_lecture
+    from lectures.data_pipelines.main import get_data_pipelines_lecture
+    from lectures.dcf_cost_capital.main import get_dcf_cost_capital_lecture
+    from lectures.dcf_fcf.main import get_dcf_fcf_lecture
+    from lectures.dynamic_excel.main import get_dynamic_salary_excel_lecture
+    from lectures.dynamic_python.main import get_dynamic_salary_python_lecture
+    from lectures.intro.main import get_intro_lecture
+    from lectures.lab_exercises.main import get_lab_exercises_lecture
+    from lectures.monte_carlo.main import get_monte_carlo_lecture
+    from lectures.probability.main import get_probability_lecture
+    from lectures.projects.main import get_projects_lecture
+    from lectures.python_basics.main import get_python_basics_lecture
+    from lectures.sensitivity_analysis.main import get_sensitivity_analysis_lecture
+    from lectures.start_python_excel.main import get_getting_started_with_python_and_excel_lecture
+    from lectures.visualization.main import get_visualization_lecture
+
+    lectures = (
         get_intro_lecture(),
         get_getting_started_with_python_and_excel_lecture(),
         get_dynamic_salary_excel_lecture(),
@@ -37,26 +46,18 @@ def get_lecture_groups(include_labs: bool = True, include_projects: bool = True)
         get_basic_q_and_a_lecture(),
         get_advanced_modeling_lecture(),
         get_data_pipelines_lecture(),
-    ]
-
-    if not include_labs and not include_projects:
-        return lectures
-
-    projects = [
+    )
+    projects = (
         get_projects_lecture(),
-    ]
-
-    if not include_labs:
-        return [*lectures, *projects]
-
-    lab_exercises = [
+    )
+    lab_exercises = (
         get_lab_exercises_lecture(),
-    ]
-
-
-
-    return [
-        *lectures,
-        *projects,
-        *lab_exercises,
-    ]
\ No newline at end of file
+    )
+
+    # Keyed by (include_labs, include_projects)
+    return {
+        (False, False): lectures,
+        (False, True): lectures + projects,
+        (True, False): lectures + lab_exercises,
+        (True, True): lectures + projects + lab_exercises,
+    }
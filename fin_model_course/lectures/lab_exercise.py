@@ -1,4 +1,5 @@
 import datetime
+from collections import Counter
 from typing import Sequence, Optional, List, Union
 
 import pyexlatex as pl
@@ -9,7 +10,12 @@ from lectures.model import Lecture, LectureNotes, LectureGroup, Serializable
 from pltemplates.exercises.lab_exercise import LabExercise
 
 
-@dataclass
+class LabExerciseModelConfig:
+    # Serializable is a Protocol, so pydantic can only validate it with an isinstance check
+    arbitrary_types_allowed = True
+
+
+@dataclass(config=LabExerciseModelConfig)
 class LabExerciseModel:
     bullet_content: Sequence[Union[str, Serializable, Sequence]]
     answers_content: Sequence[Union[str, Serializable, Sequence]] = tuple()
@@ -89,42 +95,54 @@ class LabExerciseLecture(Lecture):
 
     @property
     def _rst(self) -> str:
-        out_str = header_rst(self.title, 3)
-        out_str += self._youtube_rst
-        out_str += self._description_rst
-        out_str += self._resources_rst
-        out_str += self._answers_rst
-        return out_str
+        return ''.join([
+            header_rst(self.title, 3),
+            self._youtube_rst,
+            self._description_rst,
+            self._resources_rst,
+            self._answers_rst,
+        ])
 
     @property
     def _description_rst(self) -> str:
-        out_str = ''
-        if self.exercises is not None:
-            num_exercises = len(self.exercises)
-            out_str += header_rst('Description', 4)
-            for i, exercise in enumerate(self.exercises):
-                if num_exercises > 1:
-                    out_str += header_rst(f'Level {i + 1}', 5)
+        if self.exercises is None:
+            return ''
 
-                out_str += exercise.exercise.to_rst()
-        return out_str
+        num_exercises = len(self.exercises)
+        parts: List[str] = [header_rst('Description', 4)]
+        for i, exercise in enumerate(self.exercises):
+            if num_exercises > 1:
+                parts.append(header_rst(f'Level {i + 1}', 5))
+
+            parts.append(exercise.exercise.to_rst())
+        return ''.join(parts)
 
     @property
     def _answers_rst(self) -> str:
-        out_str = ''
         exc_with_answers = [exc for exc in self.exercises if exc.answers_content]
-        if exc_with_answers:
-            num_exercises = len(exc_with_answers)
-            out_str += header_rst('Answers', 4)
-            for i, exercise in enumerate(self.exercises):
-                if not exercise.answers_content:
-                    continue
-                if num_exercises > 1:
-                    out_str += header_rst(f'Level {i + 1}', 5)
+        if not exc_with_answers:
+            return ''
 
-                out_str += exercise.answers.to_rst()
-        return out_str
+        num_exercises = len(exc_with_answers)
+        parts: List[str] = [header_rst('Answers', 4)]
+        for i, exercise in enumerate(self.exercises):
+            if not exercise.answers_content:
+                continue
+            if num_exercises > 1:
+                parts.append(header_rst(f'Level {i + 1}', 5))
+
+            parts.append(exercise.answers.to_rst())
+        return ''.join(parts)
 
 
 class LabExerciseGroup(LectureGroup):
     lectures: Sequence[LabExerciseLecture]
+
+    def __post_init__(self):
+        super().__post_init__()
+        # Labs are looked up and labeled by their titles, so they must be unique within the group
+        for attr in ('title', 'short_title'):
+            counts = Counter(getattr(lect, attr) for lect in self.lectures)
+            duplicates = [value for value, count in counts.items() if value is not None and count > 1]
+            if duplicates:
+                raise ValueError(f'got duplicate lab exercise {attr}s {duplicates} in {self.title}')
@@ -1,14 +1,13 @@
+import dataclasses
 import datetime
-import itertools
-import time
 import warnings
-from abc import ABC, abstractmethod
+from collections import defaultdict
+from functools import cached_property
 from weakref import ref, ReferenceType
-from typing import Union, Sequence, Type, Optional, TYPE_CHECKING, TypeVar, List, Any
+from typing import Union, Sequence, Type, Optional, TYPE_CHECKING, TypeVar, List, Any, Callable, Dict, Set, Tuple, Protocol, runtime_checkable
 import urllib.parse
 
 import more_itertools
-from pydantic import BaseModel, AnyHttpUrl
 from pydantic.dataclasses import dataclass
 from youtube_transcript_api import TranscriptsDisabled
 
@@ -23,31 +22,38 @@ from pltemplates.frames.lab import LabFrame
 from pltemplates.hyperlink import Hyperlink
 
 if TYPE_CHECKING:
-    from models.content import FileContentMetadata, LectureYouTubeDescriptionMetadata
+    from models.content import FileContentMetadata
 
 import pyexlatex as pl
 
 
 T = TypeVar("T")
 
+# Headers with fixed titles, rendered once rather than on every to_rst call
+_RESOURCES_HEADER_3 = header_rst('Resources', 3)
+_RESOURCES_HEADER_4 = header_rst('Resources', 4)
+_TRANSCRIPT_HEADER_4 = header_rst('Transcript', 4)
 
-class Serializable(BaseModel, ABC):
 
-    @abstractmethod
+@runtime_checkable
+class Serializable(Protocol):
+
     def to_pyexlatex(self):
         ...
 
-    @abstractmethod
     def to_rst(self) -> str:
         ...
 
 
-
 @dataclass
 class LectureNotes:
     items: Sequence[Union[str, "LectureNotes"]]
     title: str
 
+    def __post_init__(self):
+        # Store as a tuple as items are not modified after creation
+        self.items = tuple(self.items)
+
     def __getitem__(self, item):
         return self.items[item]
 
@@ -57,17 +63,12 @@ class LectureNotes:
     def to_models(
         self, top_model: Type[T] = pl.Section, sub_model: Type = pl.UnorderedList
     ) -> T:
-        items = []
-        for item in self:
-            if isinstance(item, self.__class__):
-                items.append(item.to_models(top_model=sub_model, sub_model=sub_model))
-            else:
-                items.append(item)
-
-        # Collect strs into sub models
+        # Convert nested notes and collect strs into sub models in a single pass
         final_items = []
         current_str_items = []
-        for item in items:
+        for item in self:
+            if isinstance(item, self.__class__):
+                item = item.to_models(top_model=sub_model, sub_model=sub_model)
             if isinstance(item, str):
                 current_str_items.append(item)
             elif hasattr(item, 'to_pyexlatex'):
@@ -107,13 +108,30 @@ class LectureNotes:
 
 
 def to_pyexlatex_content(item: Any):
+    if not isinstance(item, (list, tuple)):
+        return _to_pyexlatex_leaf_content(item)
+
+    # Walk nested lists with an explicit stack, mirroring the nesting in the output
+    out_items: list = []
+    stack = [(out_items, iter(item))]
+    while stack:
+        current_out, sub_items = stack[-1]
+        for sub_item in sub_items:
+            if isinstance(sub_item, (list, tuple)):
+                nested_out: list = []
+                current_out.append(nested_out)
+                stack.append((nested_out, iter(sub_item)))
+                break
+            current_out.append(_to_pyexlatex_leaf_content(sub_item))
+        else:
+            # Exhausted this level
+            stack.pop()
+    return out_items
+
+
+def _to_pyexlatex_leaf_content(item: Any):
     if isinstance(item, str):
         return item
-    if isinstance(item, (list, tuple)):
-        out_items = []
-        for sub_item in item:
-            out_items.append(to_pyexlatex_content(sub_item))
-        return out_items
     if hasattr(item, 'to_pyexlatex'):
         return item.to_pyexlatex()
 
@@ -121,28 +139,55 @@ def to_pyexlatex_content(item: Any):
 
 
 def to_rst_bullet_content(item: Any) -> list:
+    return [_join_bullet_content(item, _to_rst_leaf_content)]
+
+
+def _to_rst_leaf_content(item: Any) -> str:
     if isinstance(item, str):
-        return [item]
-    elif isinstance(item, (list, tuple)):
-        return [' '.join(itertools.chain(*[to_rst_bullet_content(sub_item) for sub_item in item]))]
+        return item
     elif hasattr(item, 'to_rst'):
-        return [item.to_rst()]
+        return item.to_rst()
     else:
         raise ValueError(f'could not serialize {item} of type {type(item)} to rst')
 
 
 def to_youtube_bullet_content(item: Any) -> list:
+    return [_join_bullet_content(item, _to_youtube_leaf_content)]
+
+
+def _to_youtube_leaf_content(item: Any) -> str:
     if isinstance(item, str):
-        return [item]
-    elif isinstance(item, (list, tuple)):
-        return [' '.join(itertools.chain(*[to_youtube_bullet_content(sub_item) for sub_item in item]))]
+        return item
     elif hasattr(item, 'to_youtube'):
-        return [item.to_youtube()]
+        return item.to_youtube()
     else:
         raise ValueError(f'could not serialize {item} of type {type(item)} to youtube')
 
 
-class Equation(Serializable):
+def _join_bullet_content(item: Any, to_leaf_content: Callable[[Any], str]) -> str:
+    if not isinstance(item, (list, tuple)):
+        return to_leaf_content(item)
+
+    # Each nested list is joined on its own before being added to its parent
+    stack = [([], iter(item))]
+    while True:
+        parts, sub_items = stack[-1]
+        for sub_item in sub_items:
+            if isinstance(sub_item, (list, tuple)):
+                stack.append(([], iter(sub_item)))
+                break
+            parts.append(to_leaf_content(sub_item))
+        else:
+            # Exhausted this level, add it to the parent level
+            stack.pop()
+            joined = ' '.join(parts)
+            if not stack:
+                return joined
+            stack[-1][0].append(joined)
+
+
+@dataclasses.dataclass(frozen=True)
+class Equation:
     latex: str
 
     def to_pyexlatex(self):
@@ -155,12 +200,18 @@ class Equation(Serializable):
         return str(self.latex)
 
 
-class Link(Serializable):
-    href: AnyHttpUrl
-    display_text: Optional[str]
+@dataclasses.dataclass(frozen=True)
+class Link:
+    href: str
+    display_text: Optional[str] = None
+
+    def __post_init__(self):
+        parsed = urllib.parse.urlparse(self.href)
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            raise ValueError(f'expected an http or https URL for href, got {self.href}')
 
     def to_pyexlatex(self) -> Hyperlink:
-        return Hyperlink(str(self.href), self.display_text)
+        return Hyperlink(self.href, self.display_text)
 
     def to_rst(self) -> str:
         if self.display_text:
@@ -188,15 +239,26 @@ class LectureResource:
     datetime_fmt: str = "%B %e, %l:%M %p"
 
     def __eq__(self, other):
+        if self is other:
+            # Resources are usually shared instances from RESOURCES, so skip comparing fields
+            return True
         try:
-            return all([
-                self.name == other.name,
-                self.static_url == other.static_url,
-                self.external_url == other.external_url
-            ])
+            return (
+                self.name == other.name
+                and self.static_url == other.static_url
+                and self.external_url == other.external_url
+            )
         except AttributeError:
             return False
 
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def key(self) -> Tuple[str, Optional[str], Optional[str]]:
+        # The fields which determine whether two resources are the same
+        return self.name, self.static_url, self.external_url
+
     @classmethod
     def from_metadata(cls, md: "FileContentMetadata", url: Optional[str] = None) -> "LectureResource":
         from models.content import GeneratedContentMetadata
@@ -214,7 +276,7 @@ class LectureResource:
         )
         return resource
 
-    @property
+    @cached_property
     def url(self) -> Optional[str]:
         if self.static_url is not None:
             return f"/_static/{self.static_url}"
@@ -240,7 +302,7 @@ class LectureResource:
         quoted_url = urllib.parse.urlunparse(parts)
         return quoted_url
 
-    @property
+    @cached_property
     def display_name(self) -> str:
         name = ""
         if self.index is not None:
@@ -254,6 +316,10 @@ class LectureResource:
         return Hyperlink(self.full_url, self.display_name)
 
     def to_rst(self) -> str:
+        return self._rendered_rst
+
+    @cached_property
+    def _rendered_rst(self) -> str:
         if self.static_url is not None:
             return self._to_download_rst()
         if self.external_url is not None:
@@ -282,25 +348,25 @@ class Lecture:
     week_covered: int
     notes: Optional[LectureNotes] = None
     youtube_id: Optional[str] = None
-    resources: Optional[Sequence[LectureResource]] = None
+    resources: Sequence[LectureResource] = tuple()
     custom_tags: Sequence[str] = tuple()
     _transcript: Optional[Transcript] = None
     notes_section_name: str = 'Notes'
     _group_ref: Optional[ReferenceType] = None
 
     def to_rst(self) -> str:
-        out_str = header_rst(self.title, 3)
+        parts: List[str] = [header_rst(self.title, 3)]
         if self.youtube_id:
-            out_str += self._youtube_rst
+            parts.append(self._youtube_rst)
         else:
-            out_str += self._youtube_alt_rst
+            parts.append(self._youtube_alt_rst)
         if self.notes:
-            out_str += self._notes_rst
+            parts.append(self._notes_rst)
         else:
-            out_str += self._notes_alt_rst
-        out_str += self._resources_rst
-        out_str += self._transcript_rst
-        return out_str
+            parts.append(self._notes_alt_rst)
+        parts.append(self._resources_rst)
+        parts.append(self._transcript_rst)
+        return ''.join(parts)
 
     def youtube_title(self, include_group: bool = True, include_course: bool = False) -> str:
         title = self.title
@@ -415,22 +481,21 @@ class Lecture:
 
     @property
     def _resources_rst(self) -> str:
-        out_str = ''
-        if self.resources:
-            out_str += (
-                header_rst('Resources', 4)
-                + "\n"
-                + "\n".join([res.to_rst() for res in self.resources])
-                + "\n"
-            )
-        return out_str
+        if not self.resources:
+            return ''
+        return ''.join([
+            _RESOURCES_HEADER_4,
+            "\n",
+            "\n".join([res.to_rst() for res in self.resources]),
+            "\n",
+        ])
 
     @property
     def _resources_youtube(self) -> str:
         out_str = ''
         if self.resources:
             out_str += (
-                    header_rst('Resources', 4)
+                    _RESOURCES_HEADER_4
                     + '\n'
                     + "\n".join([res.to_youtube() for res in self.resources])
             )
@@ -446,7 +511,7 @@ class Lecture:
         except TranscriptsDisabled:
             return ''
 
-        out_str = header_rst('Transcript', 4)
+        out_str = _TRANSCRIPT_HEADER_4
         html = transcript.to_html()
         rst = f"""
 .. raw:: html
@@ -488,7 +553,7 @@ class LectureGroup:
     def __getitem__(self, item):
         return self.lectures[item]
 
-    @property
+    @cached_property
     def stub(self) -> str:
         lower = self.title.casefold()
         parts: List[str] = []
@@ -498,18 +563,25 @@ class LectureGroup:
         parts.extend(lower.split())
         return "-".join(parts)
 
-    @property
+    @cached_property
     def url(self) -> str:
         return f'{SITE_URL}lectures/{self.stub}'
 
     @property
     def resources(self) -> List[LectureResource]:
+        # Hand out a copy so callers can't modify the cached list
+        return list(self._resources)
+
+    @cached_property
+    def _resources(self) -> List[LectureResource]:
         resources = list(self.global_resources)
+        seen: Set[Tuple[str, Optional[str], Optional[str]]] = {res.key for res in resources}
         for lecture in self:
-            if lecture.resources:
-                for resource in lecture.resources:
-                    if resource not in resources:
-                        resources.append(resource)
+            for resource in lecture.resources:
+                key = resource.key
+                if key not in seen:
+                    seen.add(key)
+                    resources.append(resource)
         return resources
 
     @property
@@ -530,21 +602,28 @@ class LectureGroup:
         ]
 
     def to_rst(self) -> str:
-        out_str = header_rst(self.title, 2)
-        out_str += f'\n{self.description}\n'
-        if self.show_aggregate_resources and self.resources:
-            out_str += (
-                header_rst('Resources', 3)
-                + "\n"
-                + "\n".join([res.to_rst() for res in self.resources])
-                + "\n"
-            )
-        for lecture in self:
-            out_str += lecture.to_rst()
-        return out_str
+        parts: List[str] = [header_rst(self.title, 2), f'\n{self.description}\n']
+        if self.show_aggregate_resources:
+            resources = self.resources
+            if resources:
+                parts.extend([
+                    _RESOURCES_HEADER_3,
+                    "\n",
+                    "\n".join([res.to_rst() for res in resources]),
+                    "\n",
+                ])
+        parts.extend(lecture.to_rst() for lecture in self)
+        return ''.join(parts)
 
     def lectures_for_week(self, week_num: int) -> List[Lecture]:
-        return [exc for exc in self.lectures if exc.week_covered == week_num]
+        return list(self._lectures_by_week.get(week_num, ()))
+
+    @cached_property
+    def _lectures_by_week(self) -> Dict[int, List[Lecture]]:
+        lectures_by_week: Dict[int, List[Lecture]] = defaultdict(list)
+        for lecture in self.lectures:
+            lectures_by_week[lecture.week_covered].append(lecture)
+        return dict(lectures_by_week)
 
     @property
     def pyexlatex_resources_frame(self) -> Optional[Sequence[LabFrame]]: